@@ -9,9 +9,15 @@ OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY')
 CITY_NAME = os.getenv('CITY_NAME', 'London')
 COUNTRY_CODE = os.getenv('COUNTRY_CODE', 'UK')
 UNITS = os.getenv('UNITS', 'metric')  # metric, imperial, or kelvin
+# Fetch current + hourly + daily in one request (needs a One Call 3.0 subscription)
+USE_ONE_CALL = os.getenv('USE_ONE_CALL', 'false').lower() in ('1', 'true', 'yes')
 
 # Display configuration
 UPDATE_INTERVAL_MINUTES = 20
+CACHE_TTL_SECONDS = 600  # Reuse fetched weather data for this long (e.g. after a restart)
+WEATHER_CACHE_FILE = '.weather_data.json'  # Relative to the service's working directory
+STALE_CACHE_MAX_AGE_SECONDS = 3 * 3600  # Show cached data after a failed fetch for at most this long
+MIN_UPDATE_COOLDOWN = 120  # Seconds; coalesces jobs that fire back-to-back (e.g. at midnight)
 DISPLAY_WIDTH = 800
 DISPLAY_HEIGHT = 480
 
@@ -22,6 +28,8 @@ FORECAST_DAYS = 3
 SHOW_HUMIDITY = True
 SHOW_WIND = True
 SHOW_PRESSURE = True
+SMOOTH_GRAPH = False  # Spline-smooth the hourly graph curves (slower to render)
+SAVE_DEBUG_IMAGE = os.getenv('SAVE_DEBUG_IMAGE', 'false').lower() in ('1', 'true', 'yes')  # Write weather_display.png
 
 # Colors for Inky Impression (RGB values)
 BLACK = (0, 0, 0)
@@ -5,7 +5,13 @@ This creates the exact same image that would display on the Inky Impression.
 """
 
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance
+from config import SMOOTH_GRAPH
 from datetime import datetime, timedelta
+from functools import lru_cache
+import glob
+import hashlib
+import string
+import numpy as np
 import os
 
 # Display dimensions
@@ -20,7 +26,36 @@ TEXT_SECONDARY = (200, 200, 220)
 ORANGE = (255, 140, 66)
 BLUE = (100, 150, 255)
 
+# Pillow-SIMD tracks an older Pillow API that may predate Image.Resampling
+LANCZOS = getattr(Image, 'Resampling', Image).LANCZOS
 
+# Catmull-Rom basis matrix: point(t) = 0.5 * [1, t, t^2, t^3] @ M @ [p0, p1, p2, p3]
+CATMULL_ROM = np.array([
+    [0, 2, 0, 0],
+    [-1, 0, 1, 0],
+    [2, -5, 4, -1],
+    [-1, 3, -3, 1],
+])
+
+# Enhancements applied to every resized icon, in order; part of the icon cache key
+ICON_ENHANCEMENTS = (
+    (ImageEnhance.Sharpness, 1.5),
+    (ImageEnhance.Color, 1.8),
+    (ImageEnhance.Contrast, 1.5),
+)
+
+# Processed icons keyed by (name, size); raw RGBA loads keyed by (name,)
+_ICON_CACHE = {}
+
+# Rendered text widths keyed by (font id, text)
+_TEXT_WIDTH_CACHE = {}
+
+# Per-font advance widths of the characters the layout uses, keyed by font id
+_GLYPH_WIDTHS = {}
+GLYPH_CHARS = string.ascii_letters + string.digits + " °%.:/-+"
+
+
+@lru_cache(maxsize=32)
 def load_font(size, bold=False):
     """Load font with fallbacks"""
     paths = [
@@ -36,47 +71,141 @@ def load_font(size, bold=False):
     return ImageFont.load_default()
 
 
+def _load_raw_icon(name):
+    """Load the unscaled RGBA icon once, or None if it is missing"""
+    key = (name,)
+    if key not in _ICON_CACHE:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        icon_path = os.path.join(script_dir, 'icons', f'{name}.png')
+        icon = None
+        if os.path.exists(icon_path):
+            try:
+                icon = Image.open(icon_path).convert('RGBA')
+            except:
+                pass
+        _ICON_CACHE[key] = icon
+    return _ICON_CACHE[key]
+
+
 def load_icon(name, size):
-    """Load icon from icons folder"""
+    """Load icon from icons folder (cached per name and size)"""
+    key = (name, size)
+    if key in _ICON_CACHE:
+        return _ICON_CACHE[key]
+    icon = _load_raw_icon(name)
+    if icon is None:
+        return Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    try:
+        icon = icon.resize((size, size), LANCZOS)
+        for enhancer, factor in ICON_ENHANCEMENTS:
+            icon = enhancer(icon).enhance(factor)
+    except:
+        return Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    _ICON_CACHE[key] = icon
+    return icon
+
+
+def load_icon_cache(manifest):
+    """Load processed icons for every (name, size) in manifest from an on-disk cache.
+
+    The cache file is keyed on the manifest, the icon files' modification times and
+    ICON_ENHANCEMENTS, so it is rebuilt whenever the layout, an icon or the processing
+    changes. Outdated cache files are removed when a new one is written.
+    """
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    icon_path = os.path.join(script_dir, 'icons', f'{name}.png')
-    if os.path.exists(icon_path):
+    manifest = sorted(manifest)
+    stamps = []
+    for name, size in manifest:
+        icon_path = os.path.join(script_dir, 'icons', f'{name}.png')
+        mtime = os.path.getmtime(icon_path) if os.path.exists(icon_path) else 0
+        stamps.append((name, size, mtime))
+    processing = [(enhancer.__name__, factor) for enhancer, factor in ICON_ENHANCEMENTS]
+    cache_key = hashlib.sha1(repr((stamps, processing)).encode()).hexdigest()[:12]
+    cache_path = os.path.join(script_dir, f'icons_cache-{cache_key}.npz')
+
+    if os.path.exists(cache_path):
         try:
-            icon = Image.open(icon_path).convert('RGBA')
-            icon = icon.resize((size, size), Image.Resampling.LANCZOS)
-            icon = ImageEnhance.Sharpness(icon).enhance(1.5)
-            icon = ImageEnhance.Color(icon).enhance(1.8)
-            icon = ImageEnhance.Contrast(icon).enhance(1.5)
-            return icon
-        except:
-            pass
-    return Image.new('RGBA', (size, size), (0, 0, 0, 0))
+            with np.load(cache_path) as arrays:
+                for name, size in manifest:
+                    _ICON_CACHE[(name, size)] = Image.fromarray(arrays[f'{name}_{size}'], 'RGBA')
+            return
+        except Exception as e:
+            print(f"Ignoring unreadable icon cache {cache_path}: {e}")
+
+    arrays = {f'{name}_{size}': np.asarray(load_icon(name, size)) for name, size in manifest}
+    try:
+        np.savez_compressed(cache_path, **arrays)
+    except OSError as e:
+        print(f"Could not write icon cache {cache_path}: {e}")
+        return
+
+    for old_path in glob.glob(os.path.join(script_dir, 'icons_cache-*.npz')):
+        if old_path != cache_path:
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+
+def build_glyph_widths(fonts):
+    """Measure each layout character once per font"""
+    for font in fonts.values():
+        if id(font) not in _GLYPH_WIDTHS:
+            _GLYPH_WIDTHS[id(font)] = {c: font.getlength(c) for c in GLYPH_CHARS}
+
+
+def text_width(draw, text, font):
+    """Width of text in the given font, summed from glyph widths where possible"""
+    key = (id(font), text)
+    width = _TEXT_WIDTH_CACHE.get(key)
+    if width is None:
+        glyphs = _GLYPH_WIDTHS.get(id(font))
+        if glyphs is not None and all(c in glyphs for c in text):
+            width = round(sum(glyphs[c] for c in text))
+        else:
+            bbox = draw.textbbox((0, 0), text, font=font)
+            width = bbox[2] - bbox[0]
+        _TEXT_WIDTH_CACHE[key] = width
+    return width
 
 
 def bezier_curve(points, segments=20):
     """Smooth curve interpolation"""
     if len(points) < 2:
         return points
-    result = []
-    for i in range(len(points) - 1):
-        p0 = points[max(0, i - 1)]
-        p1 = points[i]
-        p2 = points[i + 1]
-        p3 = points[min(len(points) - 1, i + 2)]
-        for t_step in range(segments):
-            t = t_step / segments
-            t2, t3 = t * t, t * t * t
-            x = 0.5 * ((2 * p1[0]) + (-p0[0] + p2[0]) * t +
-                      (2 * p0[0] - 5 * p1[0] + 4 * p2[0] - p3[0]) * t2 +
-                      (-p0[0] + 3 * p1[0] - 3 * p2[0] + p3[0]) * t3)
-            y = 0.5 * ((2 * p1[1]) + (-p0[1] + p2[1]) * t +
-                      (2 * p0[1] - 5 * p1[1] + 4 * p2[1] - p3[1]) * t2 +
-                      (-p0[1] + 3 * p1[1] - 3 * p2[1] + p3[1]) * t3)
-            result.append((int(x), int(y)))
+    pts = np.asarray(points, dtype=np.float64)
+    idx = np.arange(len(pts) - 1)
+    # Control point windows (p0, p1, p2, p3) per segment, shape (N-1, 4, 2)
+    P = np.stack([pts[np.maximum(idx - 1, 0)], pts[idx], pts[idx + 1],
+                  pts[np.minimum(idx + 2, len(pts) - 1)]], axis=1)
+    t = np.arange(segments) / segments
+    T = np.stack([np.ones(segments), t, t * t, t * t * t], axis=1)
+    curves = 0.5 * (T @ (CATMULL_ROM @ P))
+    result = [tuple(p) for p in curves.reshape(-1, 2).astype(int).tolist()]
     result.append(points[-1])
     return result
 
 
+def gradient_fill(curve, color, max_alpha, bottom, depth):
+    """Fill the area under a curve, fading from max_alpha at the line to clear depth px below.
+
+    Returns the overlay sized to the curve's bounding box and its top-left position.
+    """
+    xs = [px for px, _ in curve]
+    left, top = min(xs), min(min(py for _, py in curve), bottom)
+    w, h = max(xs) - left + 1, bottom - top + 1
+    mask = Image.new('L', (w, h), 0)
+    poly = [(px - left, py - top) for px, py in curve]
+    poly += [(poly[-1][0], bottom - top), (poly[0][0], bottom - top)]
+    ImageDraw.Draw(mask).polygon(poly, fill=255)
+    under = np.asarray(mask) > 0
+    first = under.argmax(axis=0)  # First filled row in each column
+    ramp = max_alpha * (1 - (np.arange(h)[:, None] - first) / depth)
+    alpha = np.where(under, np.clip(ramp, 0, max_alpha), 0).astype(np.uint8)
+    rgb = np.broadcast_to(np.array(color, np.uint8), (h, w, 3))
+    return Image.fromarray(np.dstack([rgb, alpha]), 'RGBA'), (left, top)
+
+
 def create_screenshot():
     print("Creating screenshot...")
 
@@ -94,6 +223,7 @@ def create_screenshot():
         'forecast_day': load_font(16, bold=True),
         'forecast_temp': load_font(13),
     }
+    build_glyph_widths(fonts)
 
     # Sample data - Philadelphia with rain chances
     now = datetime.now()
@@ -135,29 +265,30 @@ def create_screenshot():
         ]
     }
 
-    # Create image with gradient background
-    img = Image.new('RGB', (WIDTH, HEIGHT), BLACK)
+    # Pre-warm the icon cache with every (name, size) the layout uses
+    detail_icons = ['sunrise', 'wind', 'visibility', 'sunset', 'humidity', 'aqi']
+    icon_sizes = {('partly_cloudy_day', 152)}
+    icon_sizes.update((name, 38) for name in detail_icons)
+    icon_sizes.update((day['icon'], 40) for day in data['forecast'])
+    load_icon_cache(icon_sizes)
+
+    # Create image with gradient background (DARK_BLUE at top fading to black)
+    factors = 1 - np.arange(HEIGHT, dtype=np.float32) / HEIGHT
+    col = np.empty((HEIGHT, 4), np.float32)
+    col[:, :3] = np.array(DARK_BLUE, np.float32) * factors[:, None]
+    col[:, 3] = 255
+    rows = np.broadcast_to(col[:, None, :], (HEIGHT, WIDTH, 4)).astype(np.uint8)
+    # Work on an opaque RGBA canvas so the graph overlays composite without mode conversion
+    img = Image.fromarray(rows, 'RGBA')
     draw = ImageDraw.Draw(img)
 
-    # Draw gradient
-    for y in range(HEIGHT):
-        factor = y / HEIGHT
-        r = int(DARK_BLUE[0] * (1 - factor))
-        g = int(DARK_BLUE[1] * (1 - factor))
-        b = int(DARK_BLUE[2] * (1 - factor))
-        draw.line([(0, y), (WIDTH, y)], fill=(r, g, b))
-
     # Header
     location = f"{data['city']}, {data['state']}"
-    bbox = draw.textbbox((0, 0), location, font=fonts['location'])
-    x = (WIDTH - (bbox[2] - bbox[0])) // 2
-    draw.text((x, 22), location, font=fonts['location'], fill=WHITE)
-
-    bbox = draw.textbbox((0, 0), data['date'], font=fonts['date'])
-    x = (WIDTH - (bbox[2] - bbox[0])) // 2
-    draw.text((x, 58), data['date'], font=fonts['date'], fill=TEXT_SECONDARY)
+    draw.text((WIDTH // 2, 22), location, font=fonts['location'], fill=WHITE, anchor='ma')
+    draw.text((WIDTH // 2, 58), data['date'], font=fonts['date'], fill=TEXT_SECONDARY, anchor='ma')
 
-    draw.text((WIDTH - 80 - len(data['time'])*8, 22), data['time'], font=fonts['date'], fill=TEXT_SECONDARY)
+    # Timestamp right-aligned 80px from the edge, matching the dashboard
+    draw.text((WIDTH - 80, 22), data['time'], font=fonts['date'], fill=TEXT_SECONDARY, anchor='ra')
 
     # Main weather icon
     icon = load_icon('partly_cloudy_day', 152)
@@ -212,41 +343,23 @@ def create_screenshot():
 
     # Temperature line
     temp_points = [(int(graph_x + i * step), int(graph_y + graph_h - ((t - temp_min) / temp_range) * graph_h)) for i, t in enumerate(temps)]
-    smooth_temp = bezier_curve(temp_points)
+    smooth_temp = bezier_curve(temp_points) if SMOOTH_GRAPH else temp_points
 
     # Orange gradient fill
-    overlay = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
-    overlay_draw = ImageDraw.Draw(overlay)
-    for layer in range(30):
-        alpha = int(80 * (1 - layer / 30))
-        y_offset = int((graph_h * layer) / 30)
-        pts = [(px, py + y_offset) for px, py in smooth_temp]
-        pts.append((smooth_temp[-1][0], graph_y + graph_h))
-        pts.append((smooth_temp[0][0], graph_y + graph_h))
-        overlay_draw.polygon(pts, fill=(*ORANGE, alpha))
-    img.paste(overlay, (0, 0), overlay)
-
-    for i in range(len(smooth_temp) - 1):
-        draw.line([smooth_temp[i], smooth_temp[i + 1]], fill=ORANGE, width=3)
+    overlay, pos = gradient_fill(smooth_temp, ORANGE, 80, graph_y + graph_h, graph_h)
+    img.alpha_composite(overlay, pos)
+
+    draw.line(smooth_temp, fill=ORANGE, width=3, joint='curve')
 
     # Rain line
     rain_points = [(int(graph_x + i * step), int(graph_y + graph_h - (h['rain'] / 100) * graph_h)) for i, h in enumerate(hourly)]
-    smooth_rain = bezier_curve(rain_points)
+    smooth_rain = bezier_curve(rain_points) if SMOOTH_GRAPH else rain_points
 
     # Blue gradient fill
-    rain_overlay = Image.new('RGBA', (WIDTH, HEIGHT), (0, 0, 0, 0))
-    rain_draw = ImageDraw.Draw(rain_overlay)
-    for layer in range(30):
-        alpha = int(60 * (1 - layer / 30))
-        y_offset = int((graph_h * layer) / 30)
-        pts = [(px, py + y_offset) for px, py in smooth_rain]
-        pts.append((smooth_rain[-1][0], graph_y + graph_h))
-        pts.append((smooth_rain[0][0], graph_y + graph_h))
-        rain_draw.polygon(pts, fill=(*BLUE, alpha))
-    img.paste(rain_overlay, (0, 0), rain_overlay)
-
-    for i in range(len(smooth_rain) - 1):
-        draw.line([smooth_rain[i], smooth_rain[i + 1]], fill=BLUE, width=2)
+    rain_overlay, pos = gradient_fill(smooth_rain, BLUE, 60, graph_y + graph_h, graph_h)
+    img.alpha_composite(rain_overlay, pos)
+
+    draw.line(smooth_rain, fill=BLUE, width=2, joint='curve')
 
     # X-axis labels
     times = ['Now', '+3h', '+6h', '+9h', '+12h', '+15h', '+18h', '+21h', '+24h', '+27h', '+30h']
@@ -259,15 +372,20 @@ def create_screenshot():
     card_w = (WIDTH - 100) // 6
     x_start = 50
 
+    # Every card shares the same geometry, so rasterize the background once
+    tile_w, tile_h = card_w - 7, HEIGHT - 14 - y_start
+    card_tile = Image.new('RGBA', (tile_w, tile_h), (0, 0, 0, 0))
+    ImageDraw.Draw(card_tile).rounded_rectangle([0, 0, tile_w - 1, tile_h - 1], radius=8,
+                                                fill=(30, 35, 50, 255), outline=(60, 65, 80, 255))
+
     for i, day in enumerate(data['forecast']):
         x = x_start + i * card_w
 
         # Card background
-        draw.rounded_rectangle([x, y_start, x + card_w - 8, HEIGHT - 15], radius=8, fill=(30, 35, 50), outline=(60, 65, 80))
+        img.alpha_composite(card_tile, (x, y_start))
 
         # Day name
-        bbox = draw.textbbox((0, 0), day['day'], font=fonts['forecast_day'])
-        text_w = bbox[2] - bbox[0]
+        text_w = text_width(draw, day['day'], fonts['forecast_day'])
         draw.text((x + (card_w - 8 - text_w) // 2, y_start + 8), day['day'], font=fonts['forecast_day'], fill=WHITE)
 
         # Icon
@@ -277,19 +395,20 @@ def create_screenshot():
         # Temps
         high = f"{day['high']}°"
         low = f"{day['low']}°"
-        bbox = draw.textbbox((0, 0), high, font=fonts['forecast_temp'])
-        draw.text((x + (card_w - 8 - (bbox[2] - bbox[0])) // 2, y_start + 75), high, font=fonts['forecast_temp'], fill=WHITE)
-        bbox = draw.textbbox((0, 0), low, font=fonts['forecast_temp'])
-        draw.text((x + (card_w - 8 - (bbox[2] - bbox[0])) // 2, y_start + 92), low, font=fonts['forecast_temp'], fill=BLUE)
+        high_w = text_width(draw, high, fonts['forecast_temp'])
+        draw.text((x + (card_w - 8 - high_w) // 2, y_start + 75), high, font=fonts['forecast_temp'], fill=WHITE)
+        low_w = text_width(draw, low, fonts['forecast_temp'])
+        draw.text((x + (card_w - 8 - low_w) // 2, y_start + 92), low, font=fonts['forecast_temp'], fill=BLUE)
 
-    # Enhance
+    # Flatten to RGB once, then enhance
+    img = img.convert('RGB')
     img = ImageEnhance.Contrast(img).enhance(1.4)
     img = ImageEnhance.Color(img).enhance(1.3)
 
     # Save
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output = os.path.join(script_dir, 'screenshot.png')
-    img.save(output)
+    img.save(output, 'PNG', compress_level=1)
     print(f"Screenshot saved: {output}")
 
 
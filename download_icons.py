@@ -3,7 +3,8 @@
 Download weather icons from InkyPi repository
 """
 
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import requests
 import os
 
 # Base URL for the icons
@@ -32,20 +33,34 @@ os.makedirs(icons_dir, exist_ok=True)
 print("Downloading weather icons from InkyPi repository...")
 print("=" * 50)
 
-downloaded = 0
-failed = 0
+# One pooled session so connections to GitHub are reused across downloads
+session = requests.Session()
+
 
-for icon_file in icon_files:
+def fetch(icon_file):
+    """Download a single icon, returning (name, error or None)"""
     try:
-        url = base_url + icon_file
-        filepath = os.path.join(icons_dir, icon_file)
+        response = session.get(base_url + icon_file, timeout=30)
+        response.raise_for_status()
+        with open(os.path.join(icons_dir, icon_file), 'wb') as f:
+            f.write(response.content)
+        return icon_file, None
+    except Exception as e:
+        return icon_file, e
+
 
-        print(f"Downloading {icon_file}...", end=" ")
-        urllib.request.urlretrieve(url, filepath)
-        print("OK")
+with ThreadPoolExecutor(max_workers=8) as executor:
+    results = list(executor.map(fetch, icon_files))
+
+downloaded = 0
+failed = 0
+
+for icon_file, error in results:
+    if error is None:
+        print(f"Downloading {icon_file}... OK")
         downloaded += 1
-    except Exception as e:
-        print(f"FAILED ({e})")
+    else:
+        print(f"Downloading {icon_file}... FAILED ({error})")
         failed += 1
 
 print("\n" + "=" * 50)
@@ -6,7 +6,6 @@ Run this to check if everything is configured correctly
 
 import sys
 import os
-from datetime import datetime
 
 def test_imports():
     """Test if all required modules can be imported"""
@@ -19,6 +18,13 @@ def test_imports():
         print("❌ requests module not found - run: pip3 install requests")
         return False
     
+    try:
+        import requests_cache
+        print("✅ requests-cache module available")
+    except ImportError:
+        print("❌ requests-cache module not found - run: pip3 install requests-cache")
+        return False
+    
     try:
         from PIL import Image, ImageDraw, ImageFont
         print("✅ PIL (Pillow) module available")
@@ -26,6 +32,13 @@ def test_imports():
         print("❌ PIL module not found - run: pip3 install Pillow")
         return False
     
+    try:
+        import numpy
+        print("✅ numpy module available")
+    except ImportError:
+        print("❌ numpy module not found - run: pip3 install numpy")
+        return False
+    
     try:
         from inky.auto import auto
         print("✅ inky module available")
@@ -1,7 +1,9 @@
-import requests
-import json
-from datetime import datetime, timedelta
-from config import OPENWEATHER_API_KEY, CITY_NAME, COUNTRY_CODE, UNITS
+import math
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import islice
+from config import OPENWEATHER_API_KEY, CITY_NAME, COUNTRY_CODE, UNITS, USE_ONE_CALL
 
 class WeatherAPI:
     def __init__(self):
@@ -10,12 +12,49 @@ class WeatherAPI:
         self.country = COUNTRY_CODE
         self.units = UNITS
         self.base_url = "http://api.openweathermap.org/data/2.5"
+        self.use_one_call = USE_ONE_CALL
+        self.coords = None
+
+        # Imported here so importing this module stays cheap until an API client is needed
+        import requests_cache
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Cache responses on disk; forecasts, UV and air quality change less often than conditions
+        self.session = requests_cache.CachedSession(
+            '.weather_cache',
+            backend='sqlite',
+            expire_after=1800,
+            # Keep the API key out of the cache file and the cache keys
+            ignored_parameters=['appid'],
+            urls_expire_after={
+                '*/data/2.5/weather': 600,
+                '*/data/3.0/onecall': 600,
+                '*/air_pollution': 3600,
+                '*/uvi': 3600,
+                '*/geo/1.0/direct': requests_cache.NEVER_EXPIRE,
+            }
+        )
+
+        # Keep connections to the API alive between updates and retry transient errors
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         if not self.api_key:
             raise ValueError("OpenWeatherMap API key not found. Please set OPENWEATHER_API_KEY in your .env file")
     
-    def get_current_weather(self):
-        """Fetch current weather data"""
+    def _fetch_json(self, url, params, timeout=10):
+        """GET a URL through the cached session and decode the JSON body"""
+        response = self.session.get(url, params=params, timeout=(3, timeout))
+        response.raise_for_status()
+        return response.json()
+
+    def _fetch_current(self):
+        """Fetch the raw current weather response, or None on failure"""
+        import requests
+
         url = f"{self.base_url}/weather"
         params = {
             'q': f"{self.city},{self.country}",
@@ -24,44 +63,52 @@ class WeatherAPI:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            # Get coordinates for additional API calls
-            lat = data['coord']['lat']
-            lon = data['coord']['lon']
-
-            # Fetch UV index and air quality
-            uv_index = self.get_uv_index(lat, lon)
-            air_quality = self.get_air_quality(lat, lon)
-
-            return {
-                'temperature': round(data['main']['temp']),
-                'feels_like': round(data['main']['feels_like']),
-                'temp_min': round(data['main']['temp_min']),
-                'temp_max': round(data['main']['temp_max']),
-                'humidity': data['main']['humidity'],
-                'pressure': data['main']['pressure'],
-                'wind_speed': data['wind']['speed'],
-                'wind_direction': data['wind'].get('deg', 0),
-                'description': data['weather'][0]['description'].title(),
-                'icon': data['weather'][0]['icon'],
-                'city': data['name'],
-                'country': data['sys']['country'],
-                'sunrise': datetime.fromtimestamp(data['sys']['sunrise']),
-                'sunset': datetime.fromtimestamp(data['sys']['sunset']),
-                'visibility': data.get('visibility', 10000) / 1000,  # Convert to km
-                'uv_index': uv_index,
-                'air_quality': air_quality,
-                'timestamp': datetime.now(),
-                'lat': lat,
-                'lon': lon
-            }
+            return self._fetch_json(url, params)
         except requests.exceptions.RequestException as e:
             print(f"Error fetching current weather: {e}")
             return None
 
+    def _parse_current(self, data, uv_index, air_quality):
+        """Build the current weather dict from the raw response and extras"""
+        return {
+            'temperature': round(data['main']['temp']),
+            'feels_like': round(data['main']['feels_like']),
+            'temp_min': round(data['main']['temp_min']),
+            'temp_max': round(data['main']['temp_max']),
+            'humidity': data['main']['humidity'],
+            'pressure': data['main']['pressure'],
+            'wind_speed': data['wind']['speed'],
+            'wind_direction': data['wind'].get('deg', 0),
+            'description': data['weather'][0]['description'].title(),
+            'icon': data['weather'][0]['icon'],
+            'city': data['name'],
+            'country': data['sys']['country'],
+            'sunrise': datetime.fromtimestamp(data['sys']['sunrise']),
+            'sunset': datetime.fromtimestamp(data['sys']['sunset']),
+            'visibility': data.get('visibility', 10000) / 1000,  # Convert to km
+            'uv_index': uv_index,
+            'air_quality': air_quality,
+            'timestamp': datetime.now(),
+            'lat': data['coord']['lat'],
+            'lon': data['coord']['lon']
+        }
+
+    def get_current_weather(self):
+        """Fetch current weather data"""
+        data = self._fetch_current()
+        if data is None:
+            return None
+
+        # Get coordinates for additional API calls
+        lat = data['coord']['lat']
+        lon = data['coord']['lon']
+
+        # Fetch UV index and air quality
+        uv_index = self.get_uv_index(lat, lon)
+        air_quality = self.get_air_quality(lat, lon)
+
+        return self._parse_current(data, uv_index, air_quality)
+
     def get_uv_index(self, lat, lon):
         """Fetch UV index data"""
         try:
@@ -73,10 +120,8 @@ class WeatherAPI:
                 'lon': lon,
                 'appid': self.api_key
             }
-            response = requests.get(url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                return round(data.get('value', 0), 1)
+            data = self._fetch_json(url, params, timeout=5)
+            return round(data.get('value', 0), 1)
         except:
             pass
         return 0
@@ -90,19 +135,19 @@ class WeatherAPI:
                 'lon': lon,
                 'appid': self.api_key
             }
-            response = requests.get(url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                aqi = data['list'][0]['main']['aqi']
-                # Convert to descriptive text
-                aqi_text = ['Good', 'Fair', 'Moderate', 'Poor', 'Very Poor']
-                return {'index': aqi, 'description': aqi_text[min(aqi-1, 4)]}
+            data = self._fetch_json(url, params, timeout=5)
+            aqi = data['list'][0]['main']['aqi']
+            # Convert to descriptive text
+            aqi_text = ['Good', 'Fair', 'Moderate', 'Poor', 'Very Poor']
+            return {'index': aqi, 'description': aqi_text[min(aqi-1, 4)]}
         except:
             pass
         return {'index': 0, 'description': 'N/A'}
     
     def get_forecast(self, days=10):
         """Fetch weather forecast for specified number of days"""
+        import requests
+
         url = f"{self.base_url}/forecast"
         params = {
             'q': f"{self.city},{self.country}",
@@ -111,18 +156,14 @@ class WeatherAPI:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_json(url, params)
 
             # Group forecasts by day
-            daily_forecasts = {}
+            daily_forecasts = defaultdict(list)
             hourly_data = []
 
             for item in data['list']:
                 date = datetime.fromtimestamp(item['dt']).date()
-                if date not in daily_forecasts:
-                    daily_forecasts[date] = []
                 daily_forecasts[date].append(item)
 
                     # Store hourly data for timeline (next 24 hours)
@@ -138,14 +179,24 @@ class WeatherAPI:
             # Get daily summaries
             forecast_days = []
             print(f"Total forecast days available: {len(daily_forecasts)}")
-            for i, (date, day_forecasts) in enumerate(list(daily_forecasts.items())[:days+1]):
+            for i, (date, day_forecasts) in enumerate(islice(daily_forecasts.items(), days+1)):
                 print(f"Processing day {i}: {date} ({date.strftime('%a')})")
-                # Get min/max temps and most common weather
-                temps = [f['main']['temp'] for f in day_forecasts]
-                weather_conditions = [f['weather'][0]['description'] for f in day_forecasts]
+                # Get min/max temps, totals and most common weather in one pass
+                min_temp = math.inf
+                max_temp = -math.inf
+                humidity_sum = 0.0
+                wind_sum = 0.0
+                weather_conditions = Counter()
+                for f in day_forecasts:
+                    temp = f['main']['temp']
+                    min_temp = min(min_temp, temp)
+                    max_temp = max(max_temp, temp)
+                    humidity_sum += f['main']['humidity']
+                    wind_sum += f['wind']['speed']
+                    weather_conditions[f['weather'][0]['description']] += 1
 
                 # Find most common weather condition
-                most_common_weather = max(set(weather_conditions), key=weather_conditions.count)
+                most_common_weather = weather_conditions.most_common(1)[0][0]
 
                 # Always use short day name (Mon, Tue, Wed, etc.)
                 day_name = date.strftime('%a')
@@ -153,12 +204,12 @@ class WeatherAPI:
                 forecast_days.append({
                     'date': date,
                     'day_name': day_name,
-                    'min_temp': round(min(temps)),
-                    'max_temp': round(max(temps)),
+                    'min_temp': round(min_temp),
+                    'max_temp': round(max_temp),
                     'description': most_common_weather.title(),
                     'icon': day_forecasts[0]['weather'][0]['icon'],
-                    'humidity': round(sum(f['main']['humidity'] for f in day_forecasts) / len(day_forecasts)),
-                    'wind_speed': round(sum(f['wind']['speed'] for f in day_forecasts) / len(day_forecasts), 1)
+                    'humidity': round(humidity_sum / len(day_forecasts)),
+                    'wind_speed': round(wind_sum / len(day_forecasts), 1)
                 })
 
             return {'daily': forecast_days, 'hourly': hourly_data}
@@ -167,10 +218,128 @@ class WeatherAPI:
             print(f"Error fetching forecast: {e}")
             return {'daily': [], 'hourly': []}
     
+    def get_coordinates(self):
+        """Look up (lat, lon) for the configured city once via the geocoding API"""
+        if self.coords is None:
+            url = "http://api.openweathermap.org/geo/1.0/direct"
+            params = {
+                'q': f"{self.city},{self.country}",
+                'limit': 1,
+                'appid': self.api_key
+            }
+            data = self._fetch_json(url, params)
+            if not data:
+                raise ValueError(f"Could not find coordinates for {self.city},{self.country}")
+            self.coords = (data[0]['lat'], data[0]['lon'])
+        return self.coords
+
+    def get_one_call_data(self):
+        """Get current weather and forecast from a single One Call 3.0 request"""
+        import requests
+
+        try:
+            lat, lon = self.get_coordinates()
+            url = "http://api.openweathermap.org/data/3.0/onecall"
+            params = {
+                'lat': lat,
+                'lon': lon,
+                'exclude': 'minutely,alerts',
+                'appid': self.api_key,
+                'units': self.units
+            }
+            # Air quality is not part of One Call, so fetch it alongside
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                aq_future = executor.submit(self.get_air_quality, lat, lon)
+                data = self._fetch_json(url, params)
+                air_quality = aq_future.result()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Error fetching One Call data: {e}")
+            return {
+                'current': None,
+                'forecast': {'daily': [], 'hourly': []},
+                'last_updated': datetime.now()
+            }
+
+        now = data['current']
+        today = data['daily'][0]
+        current = {
+            'temperature': round(now['temp']),
+            'feels_like': round(now['feels_like']),
+            'temp_min': round(today['temp']['min']),
+            'temp_max': round(today['temp']['max']),
+            'humidity': now['humidity'],
+            'pressure': now['pressure'],
+            'wind_speed': now['wind_speed'],
+            'wind_direction': now.get('wind_deg', 0),
+            'description': now['weather'][0]['description'].title(),
+            'icon': now['weather'][0]['icon'],
+            'city': self.city,
+            'country': self.country,
+            'sunrise': datetime.fromtimestamp(now['sunrise']),
+            'sunset': datetime.fromtimestamp(now['sunset']),
+            'visibility': now.get('visibility', 10000) / 1000,  # Convert to km
+            'uv_index': round(now.get('uvi', 0), 1),
+            'air_quality': air_quality,
+            'timestamp': datetime.now(),
+            'lat': lat,
+            'lon': lon
+        }
+
+        forecast_days = []
+        for day in data['daily']:
+            date = datetime.fromtimestamp(day['dt']).date()
+            forecast_days.append({
+                'date': date,
+                'day_name': date.strftime('%a'),
+                'min_temp': round(day['temp']['min']),
+                'max_temp': round(day['temp']['max']),
+                'description': day['weather'][0]['description'].title(),
+                'icon': day['weather'][0]['icon'],
+                'humidity': day['humidity'],
+                'wind_speed': round(day['wind_speed'], 1)
+            })
+
+        # "Now" followed by 3-hourly points, matching the 2.5 forecast timeline
+        hourly_data = [{
+            'time': datetime.now(),
+            'temp': current['temperature'],
+            'icon': current['icon'],
+            'rain_chance': round(data['hourly'][0].get('pop', 0) * 100) if data['hourly'] else 0
+        }]
+        for hour in data['hourly'][3::3][:7]:
+            hourly_data.append({
+                'time': datetime.fromtimestamp(hour['dt']),
+                'temp': round(hour['temp']),
+                'icon': hour['weather'][0]['icon'],
+                'rain_chance': round(hour.get('pop', 0) * 100)
+            })
+
+        return {
+            'current': current,
+            'forecast': {'daily': forecast_days, 'hourly': hourly_data},
+            'last_updated': datetime.now()
+        }
+
     def get_weather_data(self):
         """Get both current weather and forecast data"""
-        current = self.get_current_weather()
-        forecast = self.get_forecast()
+        if self.use_one_call:
+            return self.get_one_call_data()
+
+        # Requests run concurrently; UV and air quality wait only on the coordinates
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            forecast_future = executor.submit(self.get_forecast)
+            weather_future = executor.submit(self._fetch_current)
+
+            data = weather_future.result()
+            current = None
+            if data is not None:
+                lat = data['coord']['lat']
+                lon = data['coord']['lon']
+                uv_future = executor.submit(self.get_uv_index, lat, lon)
+                aq_future = executor.submit(self.get_air_quality, lat, lon)
+                current = self._parse_current(data, uv_future.result(), aq_future.result())
+
+            forecast = forecast_future.result()
 
         # Merge current weather into today's forecast for accurate today's data
         if current and forecast and forecast.get('daily') and len(forecast['daily']) > 0:
@@ -4,64 +4,262 @@ Weather Dashboard for Raspberry Pi with Inky Impression Display
 Updates every 30 minutes with current weather and forecast data
 """
 
-import schedule
+import sys
 import time
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
+import random
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
 from weather_api import WeatherAPI
-from weather_display_pil import WeatherDisplay
-from config import UPDATE_INTERVAL_MINUTES
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('weather_dashboard.log'),
-        logging.StreamHandler()
-    ]
-)
+from config import (UPDATE_INTERVAL_MINUTES, CACHE_TTL_SECONDS, WEATHER_CACHE_FILE,
+                    STALE_CACHE_MAX_AGE_SECONDS, MIN_UPDATE_COOLDOWN)
+
+# Set up logging; records are written to disk by a background thread so
+# SD-card writes stay off the update path
+_log_queue = queue.Queue(-1)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.handlers.RotatingFileHandler(
+    'weather_dashboard.log', maxBytes=512_000, backupCount=3, delay=True)
+_stream_handler = logging.StreamHandler()
+for _handler in (_file_handler, _stream_handler):
+    _handler.setFormatter(_log_formatter)
+
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+
+def stop_logging():
+    """Flush queued log records and stop the log writer thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+atexit.register(stop_logging)
 
 class WeatherDashboard:
-    def __init__(self):
+    def __init__(self, preload=True):
+        # PIL and the Inky driver are slow to import, so load them only when needed
+        from weather_display_pil import WeatherDisplay
+
         self.weather_api = WeatherAPI()
         self.display = WeatherDisplay()
+        # Pre-rendering chrome and icons only pays off over many refreshes
+        if preload:
+            self.display.prepare_static()
+            self.display.prepare_icons()
         self.last_update = None
+        self.last_update_monotonic = None
         self.update_count = 0
+        self.weather_cache = self.load_cache()
+        self._last_payload_hash = None
+        self._error_shown = False
+        self._fetch_failed = False
+        self._consecutive_failures = 0
+        # Fetching (network) and background rendering (CPU) overlap on separate workers
+        self._pool = ThreadPoolExecutor(max_workers=2)
         
         logging.info("Weather Dashboard initialized")
-        logging.info(f"Update interval: {UPDATE_INTERVAL_MINUTES} minutes")
+        logging.info("Update interval: %s minutes", UPDATE_INTERVAL_MINUTES)
     
-    def update_weather(self):
+    @staticmethod
+    def _encode_cache_value(value):
+        """JSON fallback encoder: tag datetimes and dates so they round-trip"""
+        if isinstance(value, datetime):
+            return {'__datetime__': value.isoformat()}
+        if isinstance(value, date):
+            return {'__date__': value.isoformat()}
+        raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+    @staticmethod
+    def _decode_cache_object(obj):
+        """JSON object hook reversing _encode_cache_value"""
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+        return obj
+
+    def load_cache(self):
+        """Load the last fetched weather data from disk, if any"""
+        try:
+            with open(WEATHER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f, object_hook=self._decode_cache_object)
+            if not isinstance(cache.get('ts'), (int, float)) or not isinstance(cache.get('data'), dict):
+                raise ValueError("unexpected cache layout")
+            logging.info("Loaded cached weather data from %s", WEATHER_CACHE_FILE)
+            return cache
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning("Ignoring unreadable weather cache: %s", e)
+            return None
+
+    def save_cache(self, weather_data):
+        """Persist freshly fetched weather data, replacing the file atomically"""
+        self.weather_cache = {'ts': time.time(), 'data': weather_data}
+        tmp_path = WEATHER_CACHE_FILE + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.weather_cache, f, default=self._encode_cache_value)
+            os.replace(tmp_path, WEATHER_CACHE_FILE)
+        except Exception as e:
+            logging.warning("Could not write weather cache: %s", e)
+
+    def fetch_weather_data(self):
+        """Return cached data while fresh, otherwise fetch; fall back to recent data on failure"""
+        cache = self.weather_cache
+        self._fetch_failed = False
+        if cache and time.time() - cache['ts'] < CACHE_TTL_SECONDS:
+            logging.info("Using cached weather data")
+            return cache['data']
+
+        try:
+            weather_data = self.weather_api.get_weather_data()
+        except Exception as e:
+            logging.error("Error fetching weather data: %s", e)
+            weather_data = None
+
+        if weather_data and weather_data.get('current'):
+            self.save_cache(weather_data)
+            return weather_data
+
+        self._fetch_failed = True
+        if cache:
+            age = time.time() - cache['ts']
+            # Never show yesterday's forecast as today's, however recent
+            if age < STALE_CACHE_MAX_AGE_SECONDS and date.fromtimestamp(cache['ts']) == date.today():
+                logging.warning("Fetch failed, using cached weather data from %.0f minutes ago", age / 60)
+                return cache['data']
+            logging.warning("Fetch failed and cached weather data is too old to show (%.0f minutes)", age / 60)
+
+        return weather_data
+
+    def payload_hash(self, weather_data):
+        """Hash the fields that end up on screen, ignoring fetch timestamps"""
+        current = dict(weather_data['current'])
+        timestamp = current.pop('timestamp', None)
+        forecast = weather_data.get('forecast') or {}
+        hourly = [dict(h) for h in forecast.get('hourly', [])]
+        if hourly:
+            hourly[0].pop('time', None)  # Always drawn as "Now"
+        payload = {
+            'date': timestamp.date() if timestamp else None,
+            'current': current,
+            'daily': forecast.get('daily', []),
+            'hourly': hourly,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+
+    def update_weather(self, force=False):
         """Fetch weather data and update display"""
+        # Skip if another job just ran, unless the day has rolled over since.
+        # Monotonic time keeps the cooldown immune to DST and clock changes.
+        if (not force and self.last_update_monotonic is not None
+                and time.monotonic() - self.last_update_monotonic < MIN_UPDATE_COOLDOWN
+                and self.last_update.astimezone().date() == date.today()):
+            logging.info("Skipping weather update, last update was within the cooldown window")
+            return
+
         try:
             logging.info("Starting weather update...")
             
-            # Fetch weather data
-            weather_data = self.weather_api.get_weather_data()
+            # Fetch weather data while the frame background renders
+            fetch_future = self._pool.submit(self.fetch_weather_data)
+            background_future = self._pool.submit(self.display.prepare_background)
+            weather_data = fetch_future.result()
             
             if weather_data and weather_data.get('current'):
-                # Update display
-                self.display.update_display(weather_data)
+                # Update display, unless nothing visible has changed since the last refresh
+                payload_hash = self.payload_hash(weather_data)
+                if payload_hash == self._last_payload_hash:
+                    logging.info("Weather data unchanged, skipping display refresh")
+                else:
+                    pushed = self.display.update_display(weather_data, background_future.result())
+                    if pushed is not None:
+                        self._last_payload_hash = payload_hash
+                        self._error_shown = False
+                        pushed.add_done_callback(lambda f, h=payload_hash: self._check_push(f, h))
                 
-                self.last_update = datetime.now()
-                self.update_count += 1
-                
-                logging.info(f"Weather update successful (update #{self.update_count})")
-                logging.info(f"Current temperature: {weather_data['current']['temperature']}°")
+                if self._fetch_failed:
+                    # Stale fallback: leave the cooldown alone so the retry can fetch
+                    logging.warning("Weather update failed, showing cached data")
+                else:
+                    self.last_update = datetime.now(timezone.utc)
+                    self.last_update_monotonic = time.monotonic()
+                    self.update_count += 1
+                    
+                    logging.info("Weather update successful (update #%s at %s)",
+                                 self.update_count, self.last_update.isoformat(timespec='seconds'))
+                logging.info("Current temperature: %s°", weather_data['current']['temperature'])
                 
             else:
                 logging.error("Failed to fetch weather data")
                 # Show error on display
-                self.display.update_display(None)
+                self.show_error()
                 
         except Exception as e:
-            logging.error(f"Error during weather update: {e}")
+            logging.error("Error during weather update: %s", e)
             # Try to show error on display
             try:
-                self.display.update_display(None)
+                self.show_error()
             except:
                 logging.error("Failed to update display with error message")
+            self._fetch_failed = True
+
+        # Retry soon after a failed fetch (even if stale data was shown) instead
+        # of waiting for the next regular update
+        if self._fetch_failed:
+            self.schedule_retry()
+        elif self._consecutive_failures:
+            self.clear_retries()
+
+    def _check_push(self, future, payload_hash):
+        """Forget a frame's payload hash if its panel refresh failed, so it is retried"""
+        if not future.result() and self._last_payload_hash == payload_hash:
+            self._last_payload_hash = None
+
+    def schedule_retry(self):
+        """Schedule a one-shot retry with jittered exponential backoff"""
+        import schedule
+
+        delay = min(30 * 2 ** self._consecutive_failures, 600) * random.uniform(0.8, 1.2)
+        self._consecutive_failures += 1
+        schedule.clear('retry')
+        schedule.every(delay).seconds.do(self._retry_once).tag('retry')
+        logging.info("Retrying weather update in %.0f seconds (failure #%s)", delay, self._consecutive_failures)
+
+    def clear_retries(self):
+        """Reset the backoff and drop any pending retry after a successful fetch"""
+        import schedule
+
+        self._consecutive_failures = 0
+        schedule.clear('retry')
+
+    def _retry_once(self):
+        """Retry job; runs once and then removes itself from the schedule"""
+        import schedule
+
+        self.update_weather(force=True)
+        return schedule.CancelJob
+
+    def show_error(self):
+        """Show the error screen, unless it is already on the display"""
+        if self._error_shown:
+            return
+        self.display.show_error()
+        self._error_shown = True
+        # The weather frame is gone, so redraw it once data is back
+        self._last_payload_hash = None
     
     def run_initial_update(self):
         """Run initial update immediately"""
@@ -70,6 +268,8 @@ class WeatherDashboard:
     
     def run_scheduler(self):
         """Run the scheduled updates"""
+        import schedule
+
         # Schedule regular weather updates every 30 minutes
         schedule.every(UPDATE_INTERVAL_MINUTES).minutes.do(self.update_weather)
 
@@ -77,18 +277,24 @@ class WeatherDashboard:
         schedule.every().day.at("00:00").do(self.update_weather)
 
         logging.info("Scheduler started. Press Ctrl+C to stop.")
-        logging.info(f"Weather updates: Every {UPDATE_INTERVAL_MINUTES} minutes")
+        logging.info("Weather updates: Every %s minutes", UPDATE_INTERVAL_MINUTES)
         logging.info("Midnight refresh: Enabled (00:00 daily)")
 
         try:
             while True:
+                # Sleep straight through to the next job instead of polling
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    logging.info("No scheduled jobs left")
+                    break
+                time.sleep(max(1, idle))
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
 
         except KeyboardInterrupt:
             logging.info("Weather dashboard stopped by user")
+            stop_logging()
         except Exception as e:
-            logging.error(f"Unexpected error in scheduler: {e}")
+            logging.error("Unexpected error in scheduler: %s", e)
     
     def run_once(self):
         """Run a single update and exit (useful for testing)"""
@@ -101,26 +307,25 @@ def main():
     print("🌤️  Weather Dashboard for Raspberry Pi")
     print("=" * 40)
     
+    # Check if running in test mode before building anything
+    test_mode = len(sys.argv) > 1 and sys.argv[1] == '--test'
+
     try:
-        dashboard = WeatherDashboard()
-        
-        # Run initial update
-        dashboard.run_initial_update()
+        dashboard = WeatherDashboard(preload=not test_mode)
         
-        # Check if running in test mode
-        import sys
-        if len(sys.argv) > 1 and sys.argv[1] == '--test':
+        if test_mode:
             print("Running in test mode - single update only")
             dashboard.run_once()
         else:
-            # Run scheduled updates
+            # Run initial update, then scheduled updates
+            dashboard.run_initial_update()
             dashboard.run_scheduler()
             
     except KeyboardInterrupt:
         print("\nWeather dashboard stopped by user")
     except Exception as e:
         print(f"Fatal error: {e}")
-        logging.error(f"Fatal error: {e}")
+        logging.error("Fatal error: %s", e)
 
 if __name__ == "__main__":
     main()
@@ -6,8 +6,86 @@ Renders weather dashboard with actual PNG icons to match HTML design
 
 from PIL import Image, ImageDraw, ImageFont, ImageEnhance, ImageFilter
 from inky.auto import auto
+from config import SMOOTH_GRAPH, SAVE_DEBUG_IMAGE
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+import numpy as np
 import os
+import threading
+
+# Pillow-SIMD tracks an older Pillow API that may predate Image.Resampling
+LANCZOS = getattr(Image, 'Resampling', Image).LANCZOS
+
+# Font files as (regular, medium, bold), in order of preference
+FONT_FAMILIES = (
+    ("/usr/share/fonts/truetype/inter/Inter-Regular.ttf",
+     "/usr/share/fonts/truetype/inter/Inter-Medium.ttf",
+     "/usr/share/fonts/truetype/inter/Inter-Bold.ttf"),
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+     "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+     "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"),
+)
+
+# First installed family, probed once at import (None if neither is installed)
+FONT_FAMILY = next((family for family in FONT_FAMILIES if all(os.path.exists(path) for path in family)), None)
+
+
+@lru_cache(maxsize=32)
+def _load_font(path, size):
+    """Load a TrueType font once per (path, size)"""
+    return ImageFont.truetype(path, size)
+
+
+# Local icon per OpenWeatherMap (base code, is night, windy), where windy
+# means wind >= 10mph; unknown codes fall back to "cloudy"
+_ICON_MAP = {
+    # 01 = clear sky (clear day with wind uses the windy variant)
+    ('01', False, False): "clear_day",
+    ('01', False, True): "clear_windy",
+    ('01', True, False): "clear_night",
+    ('01', True, True): "clear_night",
+    # 02 = few clouds (partly cloudy)
+    ('02', False, False): "partly_cloudy_day",
+    ('02', False, True): "partly_cloudy_day",
+    ('02', True, False): "partly_cloudy_night",
+    ('02', True, True): "partly_cloudy_night",
+    # 03 = scattered clouds, 04 = broken clouds (cloudy, windy variant during the day)
+    ('03', False, False): "cloudy",
+    ('03', False, True): "cloudy_windy",
+    ('03', True, False): "cloudy",
+    ('03', True, True): "cloudy",
+    ('04', False, False): "cloudy",
+    ('04', False, True): "cloudy_windy",
+    ('04', True, False): "cloudy",
+    ('04', True, True): "cloudy",
+    # 09 = shower rain / drizzle
+    ('09', False, False): "drizzle_day",
+    ('09', False, True): "drizzle_day",
+    ('09', True, False): "drizzle_night",
+    ('09', True, True): "drizzle_night",
+    # 10 = rain
+    ('10', False, False): "rain_day",
+    ('10', False, True): "rain_day",
+    ('10', True, False): "rain_night",
+    ('10', True, True): "rain_night",
+    # 11 = thunderstorm
+    ('11', False, False): "thunderstorm",
+    ('11', False, True): "thunderstorm",
+    ('11', True, False): "thunderstorm",
+    ('11', True, True): "thunderstorm",
+    # 13 = snow
+    ('13', False, False): "snow_day",
+    ('13', False, True): "snow_day",
+    ('13', True, False): "snow_night",
+    ('13', True, True): "snow_night",
+    # 50 = mist/fog
+    ('50', False, False): "mist",
+    ('50', False, True): "mist",
+    ('50', True, False): "mist",
+    ('50', True, True): "mist",
+}
 
 
 def get_weather_icon(icon_code, wind_speed=0):
@@ -24,109 +102,200 @@ def get_weather_icon(icon_code, wind_speed=0):
     if wind_speed >= 20:
         return "windy"
 
-    is_night = icon_code.endswith('n')
-    base_code = icon_code[:2]
+    return _ICON_MAP.get((icon_code[:2], icon_code.endswith('n'), wind_speed >= 10), "cloudy")
 
-    # Icon mapping based on OpenWeatherMap codes
-    # 01 = clear sky
-    if base_code == '01':
-        if is_night:
-            return "clear_night"
-        else:
-            # Clear day with wind >= 10mph uses windy variant
-            if wind_speed >= 10:
-                return "clear_windy"
-            return "clear_day"
 
-    # 02 = few clouds (partly cloudy)
-    elif base_code == '02':
-        if is_night:
-            return "partly_cloudy_night"
-        else:
-            return "partly_cloudy_day"
+# Catmull-Rom characteristic matrix: C(t) = 0.5 * [1, t, t^2, t^3] @ M @ [P0, P1, P2, P3]
+_CR_M = np.array([
+    [0, 2, 0, 0],
+    [-1, 0, 1, 0],
+    [2, -5, 4, -1],
+    [-1, 3, -3, 1],
+], dtype=np.float64)
 
-    # 03 = scattered clouds, 04 = broken clouds (cloudy)
-    elif base_code in ('03', '04'):
-        # Cloudy with wind >= 10mph during day uses windy variant
-        if not is_night and wind_speed >= 10:
-            return "cloudy_windy"
-        return "cloudy"
+# num_segments -> 0.5 * T @ M, where T holds the [1, t, t^2, t^3] rows
+_TM_CACHE = {}
 
-    # 09 = shower rain / drizzle
-    elif base_code == '09':
-        if is_night:
-            return "drizzle_night"
-        else:
-            return "drizzle_day"
 
-    # 10 = rain
-    elif base_code == '10':
-        if is_night:
-            return "rain_night"
-        else:
-            return "rain_day"
+def bezier_curve(points, num_segments=50):
+    """Generate smooth bezier curve points from a list of control points using Catmull-Rom splines"""
+    if len(points) < 2:
+        return points
 
-    # 11 = thunderstorm
-    elif base_code == '11':
-        return "thunderstorm"
+    TM = _TM_CACHE.get(num_segments)
+    if TM is None:
+        t = np.arange(num_segments) / num_segments
+        T = np.stack([np.ones_like(t), t, t * t, t * t * t], axis=1)
+        TM = _TM_CACHE[num_segments] = 0.5 * (T @ _CR_M)
 
-    # 13 = snow
-    elif base_code == '13':
-        if is_night:
-            return "snow_night"
-        else:
-            return "snow_day"
+    # Stack the 4 control points of every segment (with boundary handling)
+    pts = np.asarray(points, dtype=np.float64)
+    idx = np.arange(len(pts) - 1)
+    P = np.stack([
+        pts[np.clip(idx - 1, 0, None)],
+        pts[idx],
+        pts[idx + 1],
+        pts[np.clip(idx + 2, None, len(pts) - 1)],
+    ], axis=1)
+
+    # (num_segments, 4) @ (segments, 4, 2) -> (segments, num_segments, 2)
+    curve = TM @ P
+
+    result = [tuple(p) for p in curve.reshape(-1, 2).astype(np.int32).tolist()]
+
+    # Add the last point
+    result.append(points[-1])
+
+    return result
 
-    # 50 = mist/fog
-    elif base_code == '50':
-        return "mist"
 
-    # Default fallback
+# Enhancement chains as (operation, factor), applied in order like ImageEnhance
+ICON_ENHANCEMENTS = (
+    ('color', 1.8),       # 80% more saturated
+    ('contrast', 1.5),    # 50% more contrast
+)
+UI_ICON_ENHANCEMENTS = ICON_ENHANCEMENTS + (
+    ('brightness', 0.85),  # 15% darker to deepen colors
+    ('contrast', 2.0),     # Double contrast to make colors pop
+    ('color', 2.2),        # More than double saturation
+)
+FRAME_ENHANCEMENTS = (
+    ('contrast', 1.4),    # 40% more contrast for better visibility
+    ('color', 1.3),       # 30% more saturated for more vivid icons
+)
+
+# ITU-R 601 luma weights in 16-bit fixed point, as used by Pillow's convert('L')
+_LUMA_WEIGHTS = np.array([19595, 38470, 7471], dtype=np.float32)
+
+
+def enhance_rgb(img, enhancements, out=None, scratch=None):
+    """Apply a chain of ImageEnhance-style Color/Contrast/Brightness steps in one pass
+
+    Contrast and brightness map every channel value on its own, so leading
+    steps of those kinds run as 256-entry lookup tables through Image.point();
+    the rest works on a single float copy of the RGB channels. Steps clip and
+    truncate the way Pillow does, so results match chained ImageEnhance calls.
+    Alpha is left untouched.
+
+    For RGB images, pass a uint8 ``out`` array (and optionally a float32
+    ``scratch`` array) of the image's shape to reuse them across calls; the
+    result is then loaded back into ``img`` in place and ``img`` is returned.
+    """
+    target = img
+    steps = list(enhancements)
+    while steps and steps[0][0] in ('contrast', 'brightness'):
+        operation, factor = steps.pop(0)
+        if operation == 'contrast':
+            degenerate = np.float32(int(np.asarray(img.convert('L')).mean() + 0.5))
+        else:
+            degenerate = np.float32(0)
+        # Same arithmetic as below, on the 256 possible levels
+        lut = _blend(np.arange(256, dtype=np.float32), degenerate, factor).astype(np.uint8).tolist()
+        img = img.point(lut * 3 + (list(range(256)) if img.mode == 'RGBA' else []))
+
+    arr = np.asarray(img)
+    if scratch is None:
+        rgb = arr[..., :3].astype(np.float32)
     else:
-        return "cloudy"
+        rgb = scratch
+        np.copyto(rgb, arr[..., :3])
+
+    for operation, factor in steps:
+        if operation == 'color':
+            # Blend against the grayscale version of the image
+            degenerate = np.floor((rgb @ _LUMA_WEIGHTS + 0x8000) / 65536)[..., None]
+        elif operation == 'contrast':
+            # Blend against a flat image of the mean gray level
+            degenerate = np.float32(int(np.floor((rgb @ _LUMA_WEIGHTS + 0x8000) / 65536).mean() + 0.5))
+        elif operation == 'brightness':
+            # Blend against black
+            degenerate = np.float32(0)
+        else:
+            raise ValueError(f"Unknown enhancement: {operation}")
+        _blend(rgb, degenerate, factor)
 
+    if out is not None:
+        np.copyto(out, rgb, casting='unsafe')
+        target.frombytes(out)
+        return target
 
-def bezier_curve(points, num_segments=50):
-    """Generate smooth bezier curve points from a list of control points using Catmull-Rom splines"""
-    if len(points) < 2:
-        return points
+    out = rgb.astype(np.uint8)
+    if arr.shape[-1] == 4:
+        out = np.concatenate([out, arr[..., 3:]], axis=-1)
+    return Image.fromarray(out, img.mode)
 
-    result = []
 
-    # Catmull-Rom spline interpolation
-    for i in range(len(points) - 1):
-        # Get 4 points for the spline (with boundary handling)
-        p0 = points[max(0, i - 1)]
-        p1 = points[i]
-        p2 = points[i + 1]
-        p3 = points[min(len(points) - 1, i + 2)]
+def _blend(values, degenerate, factor):
+    """degenerate + factor * (values - degenerate), clipped and truncated in place"""
+    np.subtract(values, degenerate, out=values)
+    np.multiply(values, np.float32(factor), out=values)
+    np.add(values, degenerate, out=values)
+    np.clip(values, 0, 255, out=values)
+    np.floor(values, out=values)
+    return values
 
-        # Generate points along this segment
-        for t_step in range(num_segments):
-            t = t_step / num_segments
-            t2 = t * t
-            t3 = t2 * t
 
-            # Catmull-Rom basis functions
-            x = 0.5 * ((2 * p1[0]) +
-                      (-p0[0] + p2[0]) * t +
-                      (2 * p0[0] - 5 * p1[0] + 4 * p2[0] - p3[0]) * t2 +
-                      (-p0[0] + 3 * p1[0] - 3 * p2[0] + p3[0]) * t3)
 
-            y = 0.5 * ((2 * p1[1]) +
-                      (-p0[1] + p2[1]) * t +
-                      (2 * p0[1] - 5 * p1[1] + 4 * p2[1] - p3[1]) * t2 +
-                      (-p0[1] + 3 * p1[1] - 3 * p2[1] + p3[1]) * t3)
+# Header and axis labels only change with the date, minute or hour, so
+# format each distinct value once
+@lru_cache(maxsize=8)
+def _format_date(date):
+    """Header date, e.g. 'Monday, March 04'"""
+    return date.strftime('%A, %B %d')
 
-            result.append((int(x), int(y)))
 
-    # Add the last point
-    result.append(points[-1])
+@lru_cache(maxsize=64)
+def _format_clock(hour, minute):
+    """Last-updated time, e.g. '9:05am'"""
+    return datetime(2000, 1, 1, hour, minute).strftime('%I:%M%p').lstrip('0').lower()
+
+
+@lru_cache(maxsize=24)
+def _format_hour(hour):
+    """Graph time label, e.g. '3 pm'"""
+    return datetime(2000, 1, 1, hour).strftime('%I %p').lstrip('0').lower()
+
+
+@lru_cache(maxsize=256)
+def _text_bbox(text, font):
+    """Bounding box of text drawn at the origin; same result as ImageDraw.textbbox
+
+    Keyed on the font object itself (fonts come from the cached _load_font), and
+    bounded because clock, date and temperature strings change every refresh.
+    """
+    return font.getbbox(text)
+
+
+@lru_cache(maxsize=64)
+def _load_icon_cached(icon_path, size, is_ui_icon, yellowize):
+    """Open, resize and enhance an icon; the result is shared, so callers must copy it
+
+    Icons are always returned as RGBA, so callers can use them as their own paste mask.
+    """
+    icon = Image.open(icon_path).convert('RGBA')
+
+    # Use high-quality resize instead of thumbnail
+    icon = icon.resize((size, size), LANCZOS)
+
+    # Enhance sharpness for better display on e-ink
+    enhancer = ImageEnhance.Sharpness(icon)
+    icon = enhancer.enhance(1.5)  # Increase sharpness by 50%
+
+    # Saturation/contrast boosts, plus extra ones for small UI icons, in one NumPy pass
+    icon = enhance_rgb(icon, UI_ICON_ENHANCEMENTS if is_ui_icon else ICON_ENHANCEMENTS)
+
+    # Make sunrise and sunset icons completely yellow
+    if yellowize:
+        icon = WeatherDisplay.make_icon_yellow(icon)
+
+    return icon
 
-    return result
 
 class WeatherDisplay:
-    def __init__(self):
+    def __init__(self, debug_save=SAVE_DEBUG_IMAGE):
+        # Write each rendered frame to weather_display.png (off in production)
+        self.debug_save = debug_save
+
         try:
             self.display = auto()
             print(f"Detected display: {self.display.resolution}")
@@ -139,6 +308,29 @@ class WeatherDisplay:
         self.width = self.display.width
         self.height = self.display.height
 
+        # SPI transfers to the panel are not re-entrant
+        self._display_lock = threading.Lock()
+
+        # Frames are pushed from a worker so the multi-second e-ink refresh doesn't block
+        self._push_executor = ThreadPoolExecutor(max_workers=1)
+        self._push_future = None
+
+        # Hash of the frame currently on the panel, see push()
+        self._last_frame_hash = None
+
+        # Frame with the static chrome already drawn, see prepare_static()
+        self._base_img = None
+
+        # Working frame and enhancement buffers, reused by every refresh
+        self._work_img = Image.new('RGB', (self.width, self.height))
+        self._work_draw = ImageDraw.Draw(self._work_img)
+        self._work_arr = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        self._work_scratch = np.empty((self.height, self.width, 3), dtype=np.float32)
+        self._save_thread = None
+
+        # Forecast card backgrounds keyed by (width, height), see card_template()
+        self._card_templates = {}
+
         # Colors - Matte dark theme (reduces glare)
         self.WHITE = (255, 255, 255)  # Text color
         self.BLACK = (0, 0, 0)           # Pure black
@@ -146,51 +338,43 @@ class WeatherDisplay:
         self.BORDER = (100, 100, 120)  # Lighter border for dark mode
         self.TEXT_SECONDARY = (200, 200, 220)  # Slightly dimmed text
 
-        # Try to load Inter fonts (fallback to DejaVu if not available)
+        # Load Inter fonts (fallback to DejaVu if not available)
         try:
-            # Try Inter first - adjusted sizes
-            self.font_location = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Bold.ttf", 30)
-            self.font_date = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Regular.ttf", 17)
-            self.font_temp_large = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Regular.ttf", 90)
-            self.font_temp_unit = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Regular.ttf", 42)
-            self.font_feels = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Regular.ttf", 16)
-            self.font_description = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Medium.ttf", 17)
-            self.font_detail_label = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Regular.ttf", 13)
-            self.font_detail_value = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Bold.ttf", 18)
-            self.font_forecast_day = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Bold.ttf", 16)
-            self.font_forecast_temp = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Medium.ttf", 13)
-            self.font_axis = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Regular.ttf", 11)
-            self.font_footer = ImageFont.truetype("/usr/share/fonts/truetype/inter/Inter-Regular.ttf", 8)
-        except:
-            try:
-                # Fallback to DejaVu - adjusted sizes
-                self.font_location = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 30)
-                self.font_date = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 17)
-                self.font_temp_large = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 90)
-                self.font_temp_unit = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 42)
-                self.font_feels = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-                self.font_description = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 17)
-                self.font_detail_label = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 13)
-                self.font_detail_value = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 18)
-                self.font_forecast_day = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-                self.font_forecast_temp = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 13)
-                self.font_axis = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11)
-                self.font_footer = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 8)
-            except Exception as e:
-                print(f"Warning: Could not load fonts: {e}")
-                print("Using default fonts")
-                # Fallback to default
-                self.font_location = ImageFont.load_default()
-                self.font_date = ImageFont.load_default()
-                self.font_temp_large = ImageFont.load_default()
-                self.font_temp_unit = ImageFont.load_default()
-                self.font_feels = ImageFont.load_default()
-                self.font_detail_label = ImageFont.load_default()
-                self.font_detail_value = ImageFont.load_default()
-                self.font_forecast_day = ImageFont.load_default()
-                self.font_forecast_temp = ImageFont.load_default()
-                self.font_axis = ImageFont.load_default()
-                self.font_footer = ImageFont.load_default()
+            regular, medium, bold = FONT_FAMILY
+            self.font_location = _load_font(bold, 30)
+            self.font_date = _load_font(regular, 17)
+            self.font_temp_large = _load_font(regular, 90)
+            self.font_temp_unit = _load_font(regular, 42)
+            self.font_feels = _load_font(regular, 16)
+            self.font_description = _load_font(medium, 17)
+            self.font_detail_label = _load_font(regular, 13)
+            self.font_detail_value = _load_font(bold, 18)
+            self.font_forecast_day = _load_font(bold, 16)
+            self.font_forecast_temp = _load_font(medium, 13)
+            self.font_axis = _load_font(regular, 11)
+            self.font_footer = _load_font(regular, 8)
+        except Exception as e:
+            print(f"Warning: Could not load fonts: {e}")
+            print("Using default fonts")
+            # Fallback to default
+            self.font_location = ImageFont.load_default()
+            self.font_date = ImageFont.load_default()
+            self.font_temp_large = ImageFont.load_default()
+            self.font_temp_unit = ImageFont.load_default()
+            self.font_feels = ImageFont.load_default()
+            self.font_description = ImageFont.load_default()
+            self.font_detail_label = ImageFont.load_default()
+            self.font_detail_value = ImageFont.load_default()
+            self.font_forecast_day = ImageFont.load_default()
+            self.font_forecast_temp = ImageFont.load_default()
+            self.font_axis = ImageFont.load_default()
+            self.font_footer = ImageFont.load_default()
+
+        # Background gradient never changes, so every frame starts from a copy of it
+        self._bg_image = self.render_gradient()
+
+        # Error screen is fixed, so render it up front for show_error()
+        self._error_img = self.render_error_frame()
 
     def load_icon(self, icon_name, size, wind_speed=0, force_day=False):
         """Load and resize an icon with high quality
@@ -225,96 +409,55 @@ class WeatherDisplay:
             return Image.new('RGBA', (size, size), (255, 255, 255, 0))
 
         try:
-            icon = Image.open(icon_path)
-            # Convert to RGBA if needed
-            if icon.mode != 'RGBA':
-                icon = icon.convert('RGBA')
-
-            # Use high-quality resize instead of thumbnail
-            icon = icon.resize((size, size), Image.Resampling.LANCZOS)
-
-            # Enhance sharpness for better display on e-ink
-            enhancer = ImageEnhance.Sharpness(icon)
-            icon = enhancer.enhance(1.5)  # Increase sharpness by 50%
-
-            # Boost color saturation for vibrant icons
-            color_enhancer = ImageEnhance.Color(icon)
-            icon = color_enhancer.enhance(1.8)  # 80% more saturated
-
-            # Boost contrast for icons to make them pop
-            contrast_enhancer = ImageEnhance.Contrast(icon)
-            icon = contrast_enhancer.enhance(1.5)  # 50% more contrast
-
-            # Extra enhancement for small UI icons
-            if is_ui_icon:
-                # Reduce brightness to deepen colors
-                brightness_enhancer = ImageEnhance.Brightness(icon)
-                icon = brightness_enhancer.enhance(0.85)  # 15% darker
-
-                # High contrast to make colors pop
-                contrast_enhancer2 = ImageEnhance.Contrast(icon)
-                icon = contrast_enhancer2.enhance(2.0)  # Double contrast
-
-                # Extra saturation boost for UI icons
-                color_enhancer2 = ImageEnhance.Color(icon)
-                icon = color_enhancer2.enhance(2.2)  # More than double saturation
-
-            # Make sunrise and sunset icons completely yellow
-            if icon_name in ('sunrise', 'sunset'):
-                icon = self.make_icon_yellow(icon)
-
-            return icon
+            # Cached copy, so pasting or drawing on it can't alter the cache
+            return _load_icon_cached(icon_path, size, is_ui_icon, icon_name in ('sunrise', 'sunset')).copy()
         except Exception as e:
             print(f"Error loading icon {icon_path}: {e}")
             return Image.new('RGBA', (size, size), (255, 255, 255, 0))
 
-    def make_icon_yellow(self, icon):
+    @staticmethod
+    def make_icon_yellow(icon):
         """Convert icon colors to yellow while preserving transparency"""
         if icon.mode != 'RGBA':
             icon = icon.convert('RGBA')
 
-        pixels = icon.load()
-        width, height = icon.size
+        arr = np.asarray(icon, dtype=np.uint8)
+        rgb = arr[..., :3]
+        alpha = arr[..., 3:4]
 
         # Yellow color (RGB: 255, 220, 0)
-        yellow = (255, 220, 0)
-
-        for y in range(height):
-            for x in range(width):
-                r, g, b, a = pixels[x, y]
+        yellow = np.array([255, 220, 0], dtype=np.float64)
 
-                # Only modify non-transparent pixels
-                if a > 0:
-                    # Calculate brightness of original pixel
-                    brightness = (r + g + b) / 3 / 255
+        # Apply yellow with the original brightness of each pixel
+        brightness = rgb.sum(axis=-1, keepdims=True, dtype=np.float64) / 3 / 255
+        yellowed = (yellow * brightness).astype(np.uint8)
 
-                    # Apply yellow with original brightness
-                    new_r = int(yellow[0] * brightness)
-                    new_g = int(yellow[1] * brightness)
-                    new_b = int(yellow[2] * brightness)
+        # Only modify non-transparent pixels
+        out_rgb = np.where(alpha > 0, yellowed, rgb)
+        return Image.fromarray(np.concatenate([out_rgb, alpha], axis=-1), 'RGBA')
 
-                    pixels[x, y] = (new_r, new_g, new_b, a)
-
-        return icon
+    def _textbbox(self, draw, text, font):
+        """Measure text at the origin, reusing earlier results for the same text and font"""
+        return _text_bbox(text, font)
 
     def draw_header(self, draw, city, country, current_date, last_updated):
         """Draw centered header with location and date, timestamp in top right"""
         # Location - shifted down slightly more
         location = f"{city}, {country}"
-        bbox = draw.textbbox((0, 0), location, font=self.font_location)
+        bbox = self._textbbox(draw, location, self.font_location)
         text_width = bbox[2] - bbox[0]
         x = (self.width - text_width) // 2
         location_y = 22
         draw.text((x, location_y), location, font=self.font_location, fill=self.WHITE)
 
         # Date - shifted down slightly more
-        bbox = draw.textbbox((0, 0), current_date, font=self.font_date)
+        bbox = self._textbbox(draw, current_date, self.font_date)
         text_width = bbox[2] - bbox[0]
         x = (self.width - text_width) // 2
         draw.text((x, 58), current_date, font=self.font_date, fill=self.TEXT_SECONDARY)
 
         # Timestamp in top right corner, even with location
-        bbox = draw.textbbox((0, 0), last_updated, font=self.font_date)
+        bbox = self._textbbox(draw, last_updated, self.font_date)
         text_width = bbox[2] - bbox[0]
         draw.text((self.width - text_width - 80, location_y), last_updated,
                  font=self.font_date, fill=self.TEXT_SECONDARY)
@@ -327,7 +470,7 @@ class WeatherDisplay:
         wind_speed = current.get('wind_speed', 0)
         print(f"Loading MAIN weather icon: {current['icon']} (wind_speed={wind_speed})")
         icon = self.load_icon(current['icon'], 152, wind_speed=wind_speed)
-        img.paste(icon, (60, y_start - 18), icon if icon.mode == 'RGBA' else None)
+        img.paste(icon, (60, y_start - 18), icon)
 
         # Temperature - moved up more
         temp_x = 232
@@ -352,8 +495,30 @@ class WeatherDisplay:
         feels_text = f"Feels Like {current['feels_like']}°"
         draw.text((temp_x, temp_y + 116), feels_text, font=self.font_feels, fill=self.TEXT_SECONDARY)
 
-    def draw_details(self, img, draw, weather_data, y_start=90):
-        """Draw two columns of weather details with icons"""
+    # Detail rows as (icon, label) per column; values are filled in by draw_details
+    DETAIL_COLUMNS = (
+        (430, (('sunrise', 'Sunrise'), ('wind', 'Wind'), ('visibility', 'Visibility'))),
+        (590, (('sunset', 'Sunset'), ('humidity', 'Humidity'), ('aqi', 'Air Quality'))),
+    )
+
+    def draw_detail_labels(self, img, draw, y_start=90):
+        """Draw the icons and labels of the details columns, which never change"""
+        row_spacing = 50  # More vertical spacing between rows
+
+        for col_x, rows in self.DETAIL_COLUMNS:
+            for i, (icon_name, label) in enumerate(rows):
+                y = y_start + i * row_spacing
+                # Load and paste icon (38x38)
+                icon = self.load_icon(icon_name, 38)
+                img.paste(icon, (col_x, y), icon)
+                # Draw label - adjusted for larger icon
+                draw.text((col_x + 44, y + 4), label, font=self.font_detail_label, fill=self.TEXT_SECONDARY)
+
+    def draw_details(self, img, draw, weather_data, y_start=90, labels=True):
+        """Draw two columns of weather details with icons
+
+        Pass labels=False when the frame already has them from prepare_static().
+        """
         current = weather_data['current']
 
         # Column positions - shifted right to use freed space
@@ -362,6 +527,9 @@ class WeatherDisplay:
         detail_y = y_start
         row_spacing = 50  # More vertical spacing between rows
 
+        if labels:
+            self.draw_detail_labels(img, draw, y_start)
+
         # Column 1 details
         details_col1 = [
             ('sunrise', 'Sunrise', current['sunrise'].strftime('%I:%M %p').lstrip('0')),
@@ -376,28 +544,36 @@ class WeatherDisplay:
             ('aqi', 'Air Quality', f"{current.get('air_quality', {}).get('index', 0)} /10"),
         ]
 
-        # Draw column 1 - tighter spacing between icon and text
+        # Draw column 1 values - tighter spacing between icon and text
         for i, (icon_name, label, value) in enumerate(details_col1):
             y = detail_y + i * row_spacing
-            # Load and paste icon (38x38)
-            icon = self.load_icon(icon_name, 38)
-            img.paste(icon, (col1_x, y), icon if icon.mode == 'RGBA' else None)
-            # Draw label and value - adjusted for larger icon
-            draw.text((col1_x + 44, y + 4), label, font=self.font_detail_label, fill=self.TEXT_SECONDARY)
             draw.text((col1_x + 44, y + 20), value, font=self.font_detail_value, fill=self.WHITE)
 
-        # Draw column 2 - tighter spacing between icon and text
+        # Draw column 2 values - tighter spacing between icon and text
         for i, (icon_name, label, value) in enumerate(details_col2):
             y = detail_y + i * row_spacing
-            # Load and paste icon (38x38)
-            icon = self.load_icon(icon_name, 38)
-            img.paste(icon, (col2_x, y), icon if icon.mode == 'RGBA' else None)
-            # Draw label and value - adjusted for larger icon
-            draw.text((col2_x + 44, y + 4), label, font=self.font_detail_label, fill=self.TEXT_SECONDARY)
             draw.text((col2_x + 44, y + 20), value, font=self.font_detail_value, fill=self.WHITE)
 
-    def draw_graph_section(self, img, draw, hourly_data, temp_min, temp_max, y_start=245):
-        """Draw temperature graph with time labels"""
+    def draw_rain_axis(self, draw, y_start=245):
+        """Draw the fixed 0-100% rain axis labels to the right of the graph"""
+        graph_x = 85
+        graph_width = 590
+        graph_height = 80
+        graph_y = y_start + 12
+
+        # Y-axis labels (right - rain %) - outside graph area, won't overlap
+        draw.text((graph_x + graph_width + 8, graph_y - 5), "100%", font=self.font_detail_label, fill=self.TEXT_SECONDARY)
+        draw.text((graph_x + graph_width + 8, graph_y + graph_height - 8), "0%", font=self.font_detail_label, fill=self.TEXT_SECONDARY)
+
+    def draw_graph_section(self, img, draw, hourly_data, temp_min, temp_max, y_start=245, labels=True,
+                           smooth=SMOOTH_GRAPH, temps=None):
+        """Draw temperature graph with time labels
+
+        Pass labels=False when the frame already has the rain axis from prepare_static().
+        temps is the hourly temperature array from prepare_template_data(), if available.
+        With smooth=False the curves are drawn straight through the hourly points,
+        skipping the spline interpolation.
+        """
         if not hourly_data or len(hourly_data) < 2:
             return
 
@@ -413,118 +589,83 @@ class WeatherDisplay:
         draw.text((42, graph_y - 5), f"{temp_max}°F", font=self.font_detail_label, fill=self.TEXT_SECONDARY)
         draw.text((42, graph_y + graph_height - 8), f"{temp_min}°F", font=self.font_detail_label, fill=self.TEXT_SECONDARY)
 
-        # Y-axis labels (right - rain %) - outside graph area, won't overlap
-        draw.text((graph_x + graph_width + 8, graph_y - 5), "100%", font=self.font_detail_label, fill=self.TEXT_SECONDARY)
-        draw.text((graph_x + graph_width + 8, graph_y + graph_height - 8), "0%", font=self.font_detail_label, fill=self.TEXT_SECONDARY)
+        if labels:
+            self.draw_rain_axis(draw, y_start)
 
         # Calculate points for temperature line
-        temps = [h['temp'] for h in hourly_data]
+        if temps is None:
+            temps = np.array([h['temp'] for h in hourly_data])
         temp_range = temp_max - temp_min if temp_max != temp_min else 1
 
-        points = []
         step = graph_width / (len(temps) - 1) if len(temps) > 1 else graph_width
+        xs = (graph_x + np.arange(len(temps)) * step).astype(int)
 
-        for i, temp in enumerate(temps):
-            px = graph_x + i * step
-            # Invert y (higher temp = higher on screen)
-            py = graph_y + graph_height - ((temp - temp_min) / temp_range) * graph_height
-            points.append((int(px), int(py)))
+        # Invert y (higher temp = higher on screen)
+        ys = (graph_y + graph_height - ((temps - temp_min) / temp_range) * graph_height).astype(int)
+        points = list(zip(xs.tolist(), ys.tolist()))
 
         # Draw gradient fill under the temperature line using alpha blending
         ORANGE = (255, 140, 66)
         BLUE = (100, 150, 255)
 
         # Generate smooth curve points using bezier interpolation
-        smooth_temp_points = bezier_curve(points, num_segments=20) if len(points) > 1 else points
+        smooth_temp_points = bezier_curve(points, num_segments=20) if smooth and len(points) > 1 else points
 
         if len(smooth_temp_points) > 1:
-            # Create a temporary RGBA image for the gradient
-            overlay = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
-            overlay_draw = ImageDraw.Draw(overlay)
-
-            # Draw multiple layers with decreasing opacity to create gradient
-            num_layers = 30
-            for layer in range(num_layers):
-                # Calculate alpha (more transparent as we go down)
-                alpha = int(80 * (1 - layer / num_layers))
-
-                # Calculate Y offset for this layer
-                y_offset = int((graph_height * layer) / num_layers)
-
-                # Create polygon points for this layer using smooth curve
-                layer_points = []
-                for px, py in smooth_temp_points:
-                    layer_points.append((px, py + y_offset))
-
-                # Add bottom edge
-                layer_points.append((int(smooth_temp_points[-1][0]), int(graph_y + graph_height)))
-                layer_points.append((int(smooth_temp_points[0][0]), int(graph_y + graph_height)))
-
-                # Draw this layer
-                overlay_draw.polygon(layer_points, fill=(*ORANGE, alpha))
-
-            # Paste the gradient overlay onto the main image
-            img.paste(overlay, (0, 0), overlay)
+            # Single fill under the line, fading out towards the bottom of the graph
+            self.draw_gradient_fill(img, smooth_temp_points, ORANGE, 80, graph_y + graph_height, graph_height)
 
             # Draw the smooth temperature line on top
-            for i in range(len(smooth_temp_points) - 1):
-                draw.line([smooth_temp_points[i], smooth_temp_points[i + 1]], fill=ORANGE, width=3)
+            draw.line(smooth_temp_points, fill=ORANGE, width=3, joint='curve')
 
         # Calculate points for precipitation line chart
-        rain_points = []
-        for i, hour in enumerate(hourly_data):
-            rain_pct = hour.get('rain_chance', 0)
-            px = graph_x + i * step
-            # Y position based on rain percentage (0% at bottom, 100% at top)
-            py = graph_y + graph_height - (rain_pct / 100) * graph_height
-            rain_points.append((int(px), int(py)))
+        rain_pct = np.array([hour.get('rain_chance', 0) for hour in hourly_data])
+        # Y position based on rain percentage (0% at bottom, 100% at top)
+        rain_ys = (graph_y + graph_height - (rain_pct / 100) * graph_height).astype(int)
+        rain_points = list(zip(xs.tolist(), rain_ys.tolist()))
 
         # Generate smooth curve for precipitation line
         if len(rain_points) > 1:
-            smooth_rain_points = bezier_curve(rain_points, num_segments=20)
+            smooth_rain_points = bezier_curve(rain_points, num_segments=20) if smooth else rain_points
 
-            # Create a temporary RGBA image for the blue gradient under precipitation line
-            rain_overlay = Image.new('RGBA', (self.width, self.height), (0, 0, 0, 0))
-            rain_overlay_draw = ImageDraw.Draw(rain_overlay)
-
-            # Draw multiple layers with decreasing opacity to create gradient
-            num_layers = 30
-            for layer in range(num_layers):
-                # Calculate alpha (more transparent as we go down)
-                alpha = int(80 * (1 - layer / num_layers))
-
-                # Calculate Y offset for this layer
-                y_offset = int((graph_height * layer) / num_layers)
-
-                # Create polygon points for this layer using smooth curve
-                layer_points = []
-                for px, py in smooth_rain_points:
-                    layer_points.append((px, py + y_offset))
-
-                # Add bottom edge
-                layer_points.append((int(smooth_rain_points[-1][0]), int(graph_y + graph_height)))
-                layer_points.append((int(smooth_rain_points[0][0]), int(graph_y + graph_height)))
-
-                # Draw this layer in blue
-                rain_overlay_draw.polygon(layer_points, fill=(*BLUE, alpha))
-
-            # Paste the blue gradient overlay onto the main image
-            img.paste(rain_overlay, (0, 0), rain_overlay)
+            # Blue gradient under the precipitation line
+            self.draw_gradient_fill(img, smooth_rain_points, BLUE, 80, graph_y + graph_height, graph_height)
 
             # Draw the smooth precipitation line on top
-            for i in range(len(smooth_rain_points) - 1):
-                draw.line([smooth_rain_points[i], smooth_rain_points[i + 1]], fill=BLUE, width=2)
+            draw.line(smooth_rain_points, fill=BLUE, width=2, joint='curve')
 
         # Time labels below graph - show all time points (every 3 hours from API)
         label_y = graph_y + graph_height + 10
         for i, hour in enumerate(hourly_data):
             px = graph_x + i * step
             time_text = hour['time']
-            bbox = draw.textbbox((0, 0), time_text, font=self.font_axis)
+            bbox = self._textbbox(draw, time_text, self.font_axis)
             text_width = bbox[2] - bbox[0]
             draw.text((int(px - text_width // 2), label_y), time_text,
                      font=self.font_axis, fill=self.TEXT_SECONDARY)
 
+    def draw_gradient_fill(self, img, curve, color, max_alpha, bottom, depth):
+        """Fill the area under a curve, fading from max_alpha at the line to clear depth px below"""
+        # Work only within the bounding box of the filled area, not the whole canvas
+        xs = [px for px, _ in curve]
+        left = min(xs)
+        top = min(min(py for _, py in curve), bottom)
+        width = max(xs) - left + 1
+        height = bottom - top + 1
+
+        # First filled row of each column, from the curve linearly interpolated across it
+        curve_y = np.interp(np.arange(left, left + width), xs, [py for _, py in curve])
+        first = np.ceil(curve_y) - top
+
+        # Alpha ramps down with the distance below the curve in each column
+        below = np.arange(height)[:, None] - first
+        ramp = max_alpha * (1 - below / depth)
+        alpha = np.where(below >= 0, np.clip(ramp, 0, max_alpha), 0).astype(np.uint8)
+
+        rgb = np.broadcast_to(np.array(color, dtype=np.uint8), (height, width, 3))
+        overlay = Image.fromarray(np.dstack([rgb, alpha]), 'RGBA')
+        img.paste(overlay, (left, top), overlay)
+
     def draw_forecast(self, img, draw, forecast_data, y_start=370):
         """Draw forecast cards starting with Today (6 days total)"""
         if not forecast_data:
@@ -561,35 +702,37 @@ class WeatherDisplay:
             print(f"Forecast day {i}: {day_display.get('day_name', 'Unknown')} - Icon: {day.get('icon', 'N/A')}")
             self.draw_forecast_card(img, draw, day_display, card_x, y_start, card_width, card_height)
 
+    def card_template(self, width, height):
+        """Render the rounded forecast card background and border once per card size
+
+        The template has a 1px margin so the 2px border fits; paste it at (x - 1, y - 1).
+        """
+        key = (width, height)
+        template = self._card_templates.get(key)
+        if template is not None:
+            return template
+
+        template = Image.new('RGBA', (width + 3, height + 3), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(template)
+        x = y = 1
+
+        # Very dark blue body with a lighter border for dark mode
+        card_bg = (15, 20, 30)
+        draw.rounded_rectangle([x, y, x + width, y + height], radius=8,
+                               fill=card_bg, outline=self.BORDER, width=2)
+
+        self._card_templates[key] = template
+        return template
+
     def draw_forecast_card(self, img, draw, day_data, x, y, width, height):
         """Draw a single forecast card with rounded corners"""
-        # Draw rounded rectangle by drawing a rectangle and circles at corners
-        radius = 8  # Slightly smaller radius
-
-        # Main rectangle body - semi-transparent dark background
-        card_bg = (15, 20, 30)  # Very dark blue
-        draw.rectangle([x + radius, y, x + width - radius, y + height],
-                      fill=card_bg, outline=None)
-        draw.rectangle([x, y + radius, x + width, y + height - radius],
-                      fill=card_bg, outline=None)
-
-        # Draw border with lighter color for dark mode
-        # Top and bottom lines
-        draw.line([(x + radius, y), (x + width - radius, y)], fill=self.BORDER, width=2)
-        draw.line([(x + radius, y + height), (x + width - radius, y + height)], fill=self.BORDER, width=2)
-        # Left and right lines
-        draw.line([(x, y + radius), (x, y + height - radius)], fill=self.BORDER, width=2)
-        draw.line([(x + width, y + radius), (x + width, y + height - radius)], fill=self.BORDER, width=2)
-
-        # Draw corner arcs
-        draw.arc([x, y, x + radius*2, y + radius*2], start=180, end=270, fill=self.BORDER, width=2)
-        draw.arc([x + width - radius*2, y, x + width, y + radius*2], start=270, end=360, fill=self.BORDER, width=2)
-        draw.arc([x, y + height - radius*2, x + radius*2, y + height], start=90, end=180, fill=self.BORDER, width=2)
-        draw.arc([x + width - radius*2, y + height - radius*2, x + width, y + height], start=0, end=90, fill=self.BORDER, width=2)
+        # Rounded card chrome is the same for every card, so paste a cached copy
+        template = self.card_template(width, height)
+        img.paste(template, (x - 1, y - 1), template)
 
         # Day name (centered)
         day_name = day_data['day_name']
-        bbox = draw.textbbox((0, 0), day_name, font=self.font_forecast_day)
+        bbox = self._textbbox(draw, day_name, self.font_forecast_day)
         text_width = bbox[2] - bbox[0]
         draw.text((x + (width - text_width) // 2, y + 6), day_name,
                  font=self.font_forecast_day, fill=self.WHITE)
@@ -604,14 +747,9 @@ class WeatherDisplay:
         icon_x = int(x + (width - icon_size) // 2)
         icon_y = int(y + 25)
 
-        # Convert icon to have proper alpha channel and paste
+        # Paste icon (always RGBA) with transparency support
         if icon:
             try:
-                # Ensure icon is in RGBA mode
-                if icon.mode != 'RGBA':
-                    icon = icon.convert('RGBA')
-
-                # Paste icon with transparency support
                 img.paste(icon, (icon_x, icon_y), icon)
                 print(f"  Icon pasted at ({icon_x}, {icon_y})")
             except Exception as e:
@@ -622,7 +760,7 @@ class WeatherDisplay:
 
         # Temperature range (centered, adjusted for smaller card)
         temp_text = f"{day_data['max_temp']} / {day_data['min_temp']}°"
-        bbox = draw.textbbox((0, 0), temp_text, font=self.font_forecast_temp)
+        bbox = self._textbbox(draw, temp_text, self.font_forecast_temp)
         text_width = bbox[2] - bbox[0]
         draw.text((x + (width - text_width) // 2, y + 73), temp_text,
                  font=self.font_forecast_temp, fill=self.WHITE)
@@ -640,7 +778,7 @@ class WeatherDisplay:
         if forecast.get('hourly'):
             for i, hour in enumerate(forecast['hourly'][:8]):  # Take 8 points for 24 hours
                 # First point is "Now" (current weather), rest are 3-hour forecast intervals
-                time_label = "Now" if i == 0 else hour['time'].strftime('%I %p').lstrip('0').lower()
+                time_label = "Now" if i == 0 else _format_hour(hour['time'].hour)
                 hourly_data.append({
                     'time': time_label,
                     'temp': hour['temp'],
@@ -648,9 +786,11 @@ class WeatherDisplay:
                 })
 
         # Calculate temp range for graph scaling
-        temps = [h['temp'] for h in hourly_data] if hourly_data else [current['temperature']]
-        temp_min = min(temps)
-        temp_max = max(temps)
+        temps = np.array([h['temp'] for h in hourly_data] if hourly_data else [current['temperature']])
+        temp_min = temps.min().item()
+        temp_max = temps.max().item()
+
+        last_updated = weather_data.get('last_updated', datetime.now())
 
         # Format state code (convert country to state if US)
         state = current.get('country', 'US')
@@ -660,79 +800,185 @@ class WeatherDisplay:
         return {
             'city': current['city'],
             'country': state,
-            'current_date': current['timestamp'].strftime('%A, %B %d'),
+            'current_date': _format_date(current['timestamp'].date()),
             'current': current,
             'hourly_data': hourly_data,
             'temp_min': temp_min,
             'temp_max': temp_max,
+            'temps': temps,
             'forecast': forecast.get('daily', [])[:7],
-            'last_updated': weather_data.get('last_updated', datetime.now()).strftime('%I:%M%p').lstrip('0').lower()
+            'last_updated': _format_clock(last_updated.hour, last_updated.minute)
         }
 
-    def update_display(self, weather_data):
-        """Update the display with weather data"""
+    def prepare_static(self):
+        """Render the background and the labels and icons that never change, once
+
+        Later frames start from a copy of this instead of redrawing it.
+        """
+        if self._base_img is None:
+            img = self._bg_image.copy()
+            draw = ImageDraw.Draw(img)
+            self.draw_detail_labels(img, draw, y_start=90)
+            self.draw_rain_axis(draw, y_start=245)
+            self._base_img = img
+        return self._base_img
+
+    def prepare_icons(self):
+        """Decode and resize every weather icon the dashboard can show, once
+
+        Covers the current conditions icon (152px, any variant) and the forecast
+        cards (46px, day variants without wind), so refreshes never hit the disk.
+        """
+        icons = {(name, 152) for name in _ICON_MAP.values()} | {("windy", 152)}
+        icons |= {(get_weather_icon(code + 'd'), 46) for code, _, _ in _ICON_MAP}
+        for name, size in sorted(icons):
+            icon_path = f"icons/{name}.png"
+            try:
+                if os.path.exists(icon_path):
+                    _load_icon_cached(icon_path, size, False, False)
+            except Exception as e:
+                print(f"Error loading icon {icon_path}: {e}")
+
+    def prepare_background(self):
+        """Reset the working frame for drawing, including static chrome if prepared
+
+        The same image is returned every time, so wait until the previous frame
+        has been sent to the panel (and saved, if debugging) before overwriting it.
+        """
+        if self._push_future is not None:
+            self._push_future.result()
+        if self._save_thread is not None:
+            self._save_thread.join()
+        self._work_img.paste(self._base_img if self._base_img is not None else self._bg_image)
+        return self._work_img
+
+    def render_gradient(self):
+        """Render the dark gradient background that every frame starts from"""
+        # Gradient factor per row (0 at top, approaching 1 at bottom)
+        factor = (np.arange(self.height) / self.height)[:, None]
+
+        # Interpolate between DARK_BLUE and BLACK, one color per row
+        rows = (np.array(self.DARK_BLUE) * (1 - factor) + np.array(self.BLACK) * factor).astype(np.uint8)
+
+        # Repeat each row color across the full width
+        arr = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (self.height, self.width, 3)))
+        return Image.fromarray(arr, 'RGB')
+
+    def render_error_frame(self):
+        """Render the screen shown when no weather data is available"""
+        img = self._bg_image.copy()
+        draw = ImageDraw.Draw(img)
+        center_x = self.width // 2
+        center_y = self.height // 2
+        draw.text((center_x, center_y - 10), "Weather data unavailable", font=self.font_location,
+                  fill=self.WHITE, anchor='ms')
+        draw.text((center_x, center_y + 10), "Will retry at the next update", font=self.font_date,
+                  fill=self.TEXT_SECONDARY, anchor='mt')
+        return img
+
+    def push(self, img, message):
+        """Queue a frame for the panel and return without waiting for the refresh
+
+        Waits for the previous push first, so at most one frame is ever pending.
+        Frames identical to the one already on the panel are skipped. Returns a
+        future that resolves to whether the frame made it onto the panel.
+        """
+        if self._push_future is not None:
+            self._push_future.result()
+        frame_hash = hashlib.blake2b(img.tobytes(), digest_size=16).digest()
+        if frame_hash == self._last_frame_hash:
+            print(f"{message}: frame unchanged, skipping panel refresh")
+            done = Future()
+            done.set_result(True)
+            return done
+        self._push_future = self._push_executor.submit(self._push, img, message, frame_hash)
+        return self._push_future
+
+    def _push(self, img, message, frame_hash=None):
+        """Send a frame to the panel; runs on the push worker"""
+        try:
+            with self._display_lock:
+                self.display.set_image(img)
+                self.display.show()
+            self._last_frame_hash = frame_hash
+            print(f"{message} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            return True
+        except Exception as e:
+            print(f"Error pushing image to display: {e}")
+            return False
+
+    def _save_debug_image(self, img):
+        """Write a frame to weather_display.png; runs on the save thread"""
+        try:
+            img.save('weather_display.png', compress_level=1)
+            print("Weather display saved as weather_display.png")
+        except Exception as e:
+            print(f"Error saving weather_display.png: {e}")
+
+    def show_error(self):
+        """Push the pre-rendered error screen to the display"""
+        self.push(self._error_img, "Error screen shown")
+
+    def update_display(self, weather_data, background=None):
+        """Update the display with weather data
+
+        Args:
+            weather_data: Data from WeatherAPI.get_weather_data()
+            background: Optional frame from prepare_background(), so callers can
+                render it while the weather data is still being fetched. Must be
+                taken after prepare_static(), if that is used at all
+
+        Returns:
+            The future from push(), resolving to whether the panel refresh
+            succeeded, or None if the frame could not be rendered
+        """
         try:
             if not weather_data or not weather_data.get('current'):
                 print("No weather data available")
-                return
+                return None
 
             # Prepare data
             data = self.prepare_template_data(weather_data)
             if not data:
                 print("Could not prepare template data")
-                return
+                return None
 
-            # Create image with dark gradient background
-            img = Image.new("RGB", (self.width, self.height))
-            draw = ImageDraw.Draw(img)
-
-            # Draw gradient background from dark blue/black to black
-            for y in range(self.height):
-                # Calculate gradient factor (0 at top, 1 at bottom)
-                factor = y / self.height
-                # Interpolate between DARK_BLUE and BLACK
-                r = int(self.DARK_BLUE[0] * (1 - factor) + self.BLACK[0] * factor)
-                g = int(self.DARK_BLUE[1] * (1 - factor) + self.BLACK[1] * factor)
-                b = int(self.DARK_BLUE[2] * (1 - factor) + self.BLACK[2] * factor)
-                draw.line([(0, y), (self.width, y)], fill=(r, g, b))
+            # Start from the dark gradient background (plus static chrome, if prepared)
+            img = background if background is not None else self.prepare_background()
+            draw = self._work_draw if img is self._work_img else ImageDraw.Draw(img)
+            labels = self._base_img is None
 
             # Draw all sections
             self.draw_header(draw, data['city'], data['country'], data['current_date'], data['last_updated'])
             self.draw_current_weather(img, draw, data, y_start=100)
-            self.draw_details(img, draw, data, y_start=90)
-            self.draw_graph_section(img, draw, data['hourly_data'], data['temp_min'], data['temp_max'], y_start=245)
+            self.draw_details(img, draw, data, y_start=90, labels=labels)
+            self.draw_graph_section(img, draw, data['hourly_data'], data['temp_min'], data['temp_max'],
+                                    y_start=245, labels=labels, temps=data['temps'])
             self.draw_forecast(img, draw, data['forecast'], y_start=370)
 
-            # Enhance contrast for e-ink display
-            # Increase contrast for better visibility
-            contrast_enhancer = ImageEnhance.Contrast(img)
-            img = contrast_enhancer.enhance(1.4)  # 40% more contrast
-
-            # Boost color saturation for more vivid icons
-            color_enhancer = ImageEnhance.Color(img)
-            img = color_enhancer.enhance(1.3)  # 30% more saturated
+            # Enhance contrast and color saturation for e-ink display in one pass
+            img = enhance_rgb(img, FRAME_ENHANCEMENTS, out=self._work_arr, scratch=self._work_scratch)
 
-            # Save for debugging
-            img.save('weather_display.png')
-            print(f"Weather display saved as weather_display.png")
+            # Save for debugging, off the path to the panel
+            if self.debug_save:
+                self._save_thread = threading.Thread(target=self._save_debug_image, args=(img,))
+                self._save_thread.start()
 
-            # Display on e-ink
-            self.display.set_image(img)
-            self.display.show()
-
-            print(f"Weather display updated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            # Display on e-ink, in the background
+            return self.push(img, "Weather display updated")
 
         except Exception as e:
             print(f"Error updating display: {e}")
             import traceback
             traceback.print_exc()
+            return None
 
 
 def test_display():
     """Test function to verify display is working"""
     from datetime import timedelta
     try:
-        display = WeatherDisplay()
+        display = WeatherDisplay(debug_save=True)
         print("✅ Display initialized successfully")
 
         # Sample rain chances - starts low, increases tonight, then decreases